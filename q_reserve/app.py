@@ -7,7 +7,7 @@ This file creates the Flask application using the application factory pattern.
 
 import os
 from core.factory import create_app
-from core.extensions import socketio
+from core.extensions import socketio, celery  # noqa: F401 (celery -A app.celery worker)
 
 # Create Flask application
 app = create_app(os.environ.get('FLASK_ENV', 'development'))
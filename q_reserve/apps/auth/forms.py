@@ -10,7 +10,28 @@ from wtforms import StringField, PasswordField, BooleanField, SelectField, TextA
 from wtforms.validators import (
     DataRequired, Email, Length, EqualTo, ValidationError, Optional, Regexp
 )
+from core.extensions import db
 from apps.users.models import User, UserRole
+from apps.users.services import get_user_by_email
+
+# Choices for the select fields below, defined once at module level
+ROLE_CHOICES = (
+    (UserRole.END_USER.value, 'End User'),
+    (UserRole.AGENT.value, 'Support Agent'),
+    (UserRole.ADMIN.value, 'Administrator'),
+)
+
+THEME_CHOICES = (
+    ('light', 'Light'),
+    ('dark', 'Dark'),
+)
+
+LANGUAGE_CHOICES = (
+    ('en', 'English'),
+    ('es', 'Spanish'),
+    ('fr', 'French'),
+    ('de', 'German'),
+)
 
 
 class LoginForm(FlaskForm):
@@ -27,25 +48,29 @@ class LoginForm(FlaskForm):
     password = PasswordField(
         'Password',
         validators=[
-            DataRequired(message='Password is required')
+            DataRequired(message='Password is required'),
+            # Bounds the input handed to the password hash
+            Length(max=128, message='Password must be at most 128 characters')
         ]
     )
     
     remember_me = BooleanField('Remember Me')
     
+    # User resolved during validation, reused by the login view
+    user = None
+    
     def validate_username_or_email(self, field):
-        """Validate that user exists and is active."""
+        """Resolve the user for the login view."""
         # Check if it's an email or username
         if '@' in field.data:
-            user = User.query.filter_by(email=field.data.lower()).first()
+            user = get_user_by_email(field.data)
         else:
             user = User.query.filter_by(username=field.data).first()
         
-        if not user:
-            raise ValidationError('Invalid username/email or password')
-        
-        if not user.is_active_user:
-            raise ValidationError('Account is not active. Please contact administrator.')
+        # Unknown and inactive accounts are not rejected here: the login view
+        # reports them only after a (dummy) password check, so neither can be
+        # told apart from a wrong password
+        self.user = user
 
 
 class RegistrationForm(FlaskForm):
@@ -132,17 +157,25 @@ class RegistrationForm(FlaskForm):
         ]
     )
     
-    def validate_username(self, field):
-        """Check if username is already taken."""
-        user = User.query.filter_by(username=field.data).first()
-        if user:
-            raise ValidationError('Username already exists. Please choose a different one.')
-    
-    def validate_email(self, field):
-        """Check if email is already registered."""
-        user = User.query.filter_by(email=field.data.lower()).first()
-        if user:
-            raise ValidationError('Email already registered. Please use a different email or try logging in.')
+    def validate(self, extra_validators=None):
+        """Validate fields, then check username and email uniqueness in one query."""
+        if not super().validate(extra_validators=extra_validators):
+            return False
+        
+        email = self.email.data.lower()
+        taken = db.session.execute(
+            db.select(User.username, User.email).where(
+                db.or_(User.username == self.username.data, User.email == email)
+            )
+        ).all()
+        
+        for username, user_email in taken:
+            if username == self.username.data:
+                self.username.errors.append('Username already exists. Please choose a different one.')
+            if user_email == email:
+                self.email.errors.append('Email already registered. Please use a different email or try logging in.')
+        
+        return not taken
 
 
 class AdminRegistrationForm(RegistrationForm):
@@ -150,11 +183,7 @@ class AdminRegistrationForm(RegistrationForm):
     
     role = SelectField(
         'Role',
-        choices=[
-            (UserRole.END_USER.value, 'End User'),
-            (UserRole.AGENT.value, 'Support Agent'),
-            (UserRole.ADMIN.value, 'Administrator')
-        ],
+        choices=ROLE_CHOICES,
         default=UserRole.END_USER.value,
         validators=[DataRequired(message='Role is required')]
     )
@@ -170,12 +199,6 @@ class ForgotPasswordForm(FlaskForm):
             Email(message='Invalid email address')
         ]
     )
-    
-    def validate_email(self, field):
-        """Check if email exists in system."""
-        user = User.query.filter_by(email=field.data.lower()).first()
-        if not user:
-            raise ValidationError('No account found with this email address.')
 
 
 class ResetPasswordForm(FlaskForm):
@@ -208,7 +231,8 @@ class ChangePasswordForm(FlaskForm):
     current_password = PasswordField(
         'Current Password',
         validators=[
-            DataRequired(message='Current password is required')
+            DataRequired(message='Current password is required'),
+            Length(max=128, message='Password must be at most 128 characters')
         ]
     )
     
@@ -298,21 +322,13 @@ class ProfileForm(FlaskForm):
     
     theme = SelectField(
         'Theme',
-        choices=[
-            ('light', 'Light'),
-            ('dark', 'Dark')
-        ],
+        choices=THEME_CHOICES,
         default='light'
     )
     
     language = SelectField(
         'Language',
-        choices=[
-            ('en', 'English'),
-            ('es', 'Spanish'),
-            ('fr', 'French'),
-            ('de', 'German')
-        ],
+        choices=LANGUAGE_CHOICES,
         default='en'
     )
     
@@ -329,8 +345,11 @@ class ProfileForm(FlaskForm):
     def validate_email(self, field):
         """Check if email is already taken by another user."""
         if self.user and field.data.lower() != self.user.email.lower():
-            user = User.query.filter_by(email=field.data.lower()).first()
-            if user:
+            # EXISTS stops at the first match without loading a User row
+            taken = db.session.query(
+                db.exists().where(User.email == field.data.lower())
+            ).scalar()
+            if taken:
                 raise ValidationError('Email already in use by another account.')
 
 
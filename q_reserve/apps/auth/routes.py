@@ -4,10 +4,11 @@ Authentication routes for Q-Reserve application.
 This module handles user authentication, registration, and password management routes.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from flask import Blueprint, request, render_template, redirect, url_for, flash, current_app
 from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.urls import url_parse
+from sqlalchemy.exc import IntegrityError
 
 from core.extensions import db, limiter
 from core.utils import generate_secure_token
@@ -16,8 +17,7 @@ from apps.auth.forms import (
     ResetPasswordForm, ChangePasswordForm
 )
 from apps.users.models import User, UserRole
-from apps.auth.utils import send_password_reset_email
-from apps.notifications.sender import send_welcome_email
+from apps.auth.utils import profile_url, verify_dummy_password
 
 # Create blueprint
 bp = Blueprint('auth', __name__)
@@ -33,11 +33,8 @@ def login():
     form = LoginForm()
     
     if form.validate_on_submit():
-        # Determine if login is with email or username
-        if '@' in form.username_or_email.data:
-            user = User.query.filter_by(email=form.username_or_email.data.lower()).first()
-        else:
-            user = User.query.filter_by(username=form.username_or_email.data).first()
+        # The form already looked the user up while validating
+        user = form.user
         
         if user and user.verify_password(form.password.data):
             if not user.is_active_user:
@@ -47,23 +44,31 @@ def login():
             # Log the user in
             login_user(user, remember=form.remember_me.data)
             
-            # Update last login time
-            user.update_last_login()
-            
             # Get next page from query parameter
             next_page = request.args.get('next')
             if not next_page or url_parse(next_page).netloc != '':
-                # Redirect based on user role
-                if user.is_admin:
-                    next_page = url_for('dashboard.admin')
-                elif user.is_agent:
-                    next_page = url_for('dashboard.agent')
-                else:
-                    next_page = url_for('tickets.list')
+                # The index redirects based on user role
+                next_page = url_for('index')
             
             flash(f'Welcome back, {user.display_name}!', 'success')
+            
+            # Upgrade hashes made with an old method or cost while the
+            # plaintext is at hand; saved by the commit below
+            if (current_app.config['PASSWORD_HASH_REHASH_ON_LOGIN']
+                    and user.password_needs_rehash()):
+                user.password = form.password.data
+            
+            # Commit last (one UPDATE, together with any rehash above): the
+            # commit expires the user, and reading it afterwards would reload
+            # the row
+            user.update_last_login()
+            db.session.commit()
+            
             return redirect(next_page)
         else:
+            if user is None:
+                # Do the same hashing work as for a wrong password
+                verify_dummy_password(form.password.data)
             flash('Invalid username/email or password.', 'error')
     
     return render_template('auth/login.html', form=form)
@@ -99,15 +104,21 @@ def register():
             db.session.add(user)
             db.session.commit()
             
-            # Send welcome email
+            # Queue welcome email (imported here so other auth views skip the email stack)
+            from apps.notifications.tasks import send_welcome_email_task
             try:
-                send_welcome_email(user)
+                send_welcome_email_task.delay(user.id, request.host_url)
             except Exception as e:
-                current_app.logger.error(f"Failed to send welcome email: {e}")
+                current_app.logger.error(f"Failed to queue welcome email: {e}")
             
             flash('Registration successful! Please check your email to verify your account.', 'success')
             return redirect(url_for('auth.login'))
             
+        except IntegrityError:
+            # Lost a race with a concurrent registration for the same username/email
+            db.session.rollback()
+            flash('Username or email already registered.', 'error')
+            
         except Exception as e:
             db.session.rollback()
             current_app.logger.error(f"Registration error: {e}")
@@ -135,25 +146,16 @@ def forgot_password():
     form = ForgotPasswordForm()
     
     if form.validate_on_submit():
-        user = User.query.filter_by(email=form.email.data.lower()).first()
-        
-        if user:
-            # Generate password reset token
-            user.password_reset_token = generate_secure_token()
-            user.password_reset_expires = datetime.utcnow() + timedelta(hours=1)
-            
-            db.session.commit()
-            
-            # Send password reset email
-            try:
-                send_password_reset_email(user)
-                flash('Password reset instructions have been sent to your email.', 'info')
-            except Exception as e:
-                current_app.logger.error(f"Failed to send password reset email: {e}")
-                flash('Failed to send password reset email. Please try again.', 'error')
-        else:
-            # Don't reveal that email doesn't exist for security
+        # The account lookup, reset token and email are all handled by the
+        # worker, so the response does not depend on whether the address is
+        # registered
+        from apps.notifications.tasks import send_password_reset_email_task
+        try:
+            send_password_reset_email_task.delay(form.email.data.lower(), request.host_url)
             flash('If an account with that email exists, you will receive password reset instructions.', 'info')
+        except Exception as e:
+            current_app.logger.error(f"Failed to queue password reset email: {e}")
+            flash('Failed to send password reset email. Please try again.', 'error')
         
         return redirect(url_for('auth.login'))
     
@@ -212,7 +214,7 @@ def change_password():
             db.session.commit()
             
             flash('Your password has been changed successfully.', 'success')
-            return redirect(url_for('users.profile'))
+            return redirect(profile_url())
             
         except Exception as e:
             db.session.rollback()
@@ -258,20 +260,22 @@ def resend_verification():
     """Resend email verification."""
     if current_user.email_verified_at:
         flash('Email already verified.', 'info')
-        return redirect(url_for('users.profile'))
+        return redirect(profile_url())
+    
+    from apps.notifications.tasks import send_welcome_email_task
     
     try:
         current_user.email_verification_token = generate_secure_token()
         db.session.commit()
         
-        send_welcome_email(current_user)
+        send_welcome_email_task.delay(current_user.id, request.host_url)
         flash('Verification email sent. Please check your inbox.', 'info')
         
     except Exception as e:
         current_app.logger.error(f"Failed to resend verification email: {e}")
         flash('Failed to send verification email. Please try again.', 'error')
     
-    return redirect(url_for('users.profile'))
+    return redirect(profile_url())
 
 
 # Error handlers for authentication blueprint
@@ -4,14 +4,23 @@ Authentication utility functions for Q-Reserve application.
 This module contains helper functions for authentication-related operations.
 """
 
+import re
+import secrets
 from functools import wraps
-from flask import abort, current_app, url_for
+from flask import abort, current_app, url_for, render_template
 from flask_login import current_user
 from flask_mail import Message
+from werkzeug.security import generate_password_hash, check_password_hash
 
 from core.extensions import mail
 from apps.users.models import UserRole
 
+# Special characters recommended in passwords, compiled once at import
+_SPECIAL_CHAR_RE = re.compile('[' + re.escape("!@#$%^&*()_+-=[]{}|;:,.<>?") + ']')
+
+# Hash checked for logins naming unknown accounts, generated on first use
+_dummy_password_hash = None
+
 
 def role_required(*roles):
     """
@@ -20,14 +29,18 @@ def role_required(*roles):
     Args:
         *roles: Required user roles (admin, agent, end_user)
     """
+    # Resolved once at decoration time rather than on every request
+    allowed_roles = frozenset(
+        role.value if hasattr(role, 'value') else role for role in roles
+    )
+    
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
             if not current_user.is_authenticated:
                 abort(401)
             
-            user_role = current_user.role.value
-            if user_role not in [role.value if hasattr(role, 'value') else role for role in roles]:
+            if current_user.role.value not in allowed_roles:
                 abort(403)
             
             return f(*args, **kwargs)
@@ -35,6 +48,19 @@ def role_required(*roles):
     return decorator
 
 
+def profile_url():
+    """
+    Get the URL to return to after an account change.
+    
+    Returns:
+        str: The profile page, or the home page when the users blueprint is
+        not enabled
+    """
+    if 'users' in current_app.blueprints:
+        return url_for('users.profile')
+    return url_for('index')
+
+
 def admin_required(f):
     """Decorator to require admin role."""
     return role_required(UserRole.ADMIN)(f)
@@ -45,6 +71,31 @@ def agent_required(f):
     return role_required(UserRole.AGENT, UserRole.ADMIN)(f)
 
 
+def verify_dummy_password(password):
+    """
+    Check a password against a throwaway hash.
+    
+    Performs the same hashing work as a real password check so that a login
+    for an unknown account is not measurably faster than a wrong password.
+    
+    Args:
+        password: Password submitted with the login attempt
+        
+    Returns:
+        bool: Always False
+    """
+    global _dummy_password_hash
+    
+    if _dummy_password_hash is None:
+        _dummy_password_hash = generate_password_hash(
+            secrets.token_urlsafe(16),
+            method=current_app.config['PASSWORD_HASH_METHOD']
+        )
+    
+    check_password_hash(_dummy_password_hash, password)
+    return False
+
+
 def send_password_reset_email(user):
     """
     Send password reset email to user.
@@ -59,17 +110,9 @@ def send_password_reset_email(user):
     
     subject = "Password Reset - Q-Reserve"
     
-    html_body = f"""
-    <h2>Password Reset Request</h2>
-    <p>Hello {user.display_name},</p>
-    <p>You have requested to reset your password for your Q-Reserve account.</p>
-    <p>Click the link below to reset your password:</p>
-    <p><a href="{reset_url}" style="color: #007bff;">Reset Password</a></p>
-    <p>This link will expire in 1 hour.</p>
-    <p>If you did not request this password reset, please ignore this email.</p>
-    <br>
-    <p>Best regards,<br>Q-Reserve Team</p>
-    """
+    html_body = render_template('emails/password_reset.html',
+                               user=user,
+                               reset_url=reset_url)
     
     text_body = f"""
     Password Reset Request
@@ -128,7 +171,7 @@ def check_password_strength(password):
         feedback.append("Password must contain at least one number")
         is_strong = False
     
-    if not any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+    if not _SPECIAL_CHAR_RE.search(password):
         feedback.append("Password should contain at least one special character")
     
     if len(password) > 20:
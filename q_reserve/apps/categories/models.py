@@ -28,14 +28,23 @@ class Category(db.Model):
     is_active = db.Column(db.Boolean, default=True, nullable=False)
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Inserts still send utcnow, so tables created before the server defaults
+    # (there is no migration adding them) keep working; onupdate is rendered
+    # into the UPDATE. timezone('utc', now()) is PostgreSQL-only.
+    created_at = db.Column(db.DateTime, default=datetime.utcnow,
+                           server_default=db.func.timezone('utc', db.func.now()), nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow,
+                           server_default=db.func.timezone('utc', db.func.now()),
+                           onupdate=db.func.timezone('utc', db.func.now()))
     
     # Relationships
+    # Tickets stay dynamic: the collection is unbounded and only ever counted
+    # or filtered. Children are few and iterated, so they load as a list and
+    # can be eager-loaded by callers.
     tickets = db.relationship('Ticket', backref='category', lazy='dynamic')
-    children = db.relationship('Category', 
-                             backref=db.backref('parent', remote_side=[id]),
-                             lazy='dynamic')
+    children = db.relationship('Category', back_populates='parent', lazy='select',
+                               order_by=[sort_order, name])
+    parent = db.relationship('Category', back_populates='children', remote_side=[id])
     
     def __init__(self, **kwargs):
         """Initialize category with default values."""
@@ -45,23 +54,20 @@ class Category(db.Model):
         if not self.icon:
             self.icon = 'folder'
     
-    @property
-    def ticket_count(self):
-        """Get number of tickets in this category."""
-        return self.tickets.count()
-    
-    @property
-    def active_ticket_count(self):
-        """Get number of active tickets in this category."""
-        from apps.tickets.models import TicketStatus
-        return self.tickets.filter(
-            ~db.and_(
-                db.or_(
-                    db.text("status = 'resolved'"),
-                    db.text("status = 'closed'")
-                )
-            )
-        ).count()
+    def get_ticket_counts(self):
+        """
+        Get total and active ticket counts with a single aggregate query.
+        
+        Active tickets are those not resolved or closed.
+        
+        Returns:
+            tuple: (ticket_count, active_ticket_count)
+        """
+        status = db.literal_column('tickets.status')
+        return tuple(self.tickets.with_entities(
+            db.func.count(),
+            db.func.count().filter(status.notin_(['resolved', 'closed']))
+        ).one())
     
     @property
     def full_path(self):
@@ -80,11 +86,16 @@ class Category(db.Model):
     
     def can_be_deleted(self):
         """Check if category can be safely deleted."""
-        # Cannot delete if it has tickets or child categories
-        return self.ticket_count == 0 and self.children.count() == 0
+        # Cannot delete if it has tickets or child categories. A single
+        # EXISTS query stops at the first matching row instead of counting.
+        has_children = db.session.query(Category.id).filter_by(parent_id=self.id).exists()
+        return not db.session.query(
+            db.or_(self.tickets.exists(), has_children)
+        ).scalar()
     
     def to_dict(self):
         """Convert category to dictionary for API responses."""
+        ticket_count, active_ticket_count = self.get_ticket_counts()
         return {
             'id': self.id,
             'name': self.name,
@@ -94,8 +105,8 @@ class Category(db.Model):
             'parent_id': self.parent_id,
             'sort_order': self.sort_order,
             'is_active': self.is_active,
-            'ticket_count': self.ticket_count,
-            'active_ticket_count': self.active_ticket_count,
+            'ticket_count': ticket_count,
+            'active_ticket_count': active_ticket_count,
             'full_path': self.full_path,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
@@ -16,8 +16,9 @@ def send_welcome_email(user):
     Args:
         user: User object
     """
-    if not current_app.config.get('ENABLE_EMAIL_NOTIFICATIONS', True):
-        current_app.logger.info(f"Email notifications disabled, skipping welcome email for {user.email}")
+    logger = current_app.logger
+    if not current_app.config['ENABLE_EMAIL_NOTIFICATIONS']:
+        logger.info(f"Email notifications disabled, skipping welcome email for {user.email}")
         return
     
     subject = "Welcome to Q-Reserve!"
@@ -58,10 +59,10 @@ def send_welcome_email(user):
             body=text_body
         )
         mail.send(msg)
-        current_app.logger.info(f"Welcome email sent to {user.email}")
+        logger.info(f"Welcome email sent to {user.email}")
         
     except Exception as e:
-        current_app.logger.error(f"Failed to send welcome email to {user.email}: {e}")
+        logger.error(f"Failed to send welcome email to {user.email}: {e}")
         raise
 
 
@@ -74,7 +75,7 @@ def send_ticket_notification(ticket, action, recipient_user):
         action: Action type (created, updated, assigned, etc.)
         recipient_user: User to receive notification
     """
-    if not current_app.config.get('ENABLE_EMAIL_NOTIFICATIONS', True):
+    if not current_app.config['ENABLE_EMAIL_NOTIFICATIONS']:
         return
     
     if not recipient_user.email_notifications:
@@ -92,7 +93,7 @@ def send_comment_notification(comment, recipient_user):
         comment: Comment object
         recipient_user: User to receive notification
     """
-    if not current_app.config.get('ENABLE_EMAIL_NOTIFICATIONS', True):
+    if not current_app.config['ENABLE_EMAIL_NOTIFICATIONS']:
         return
     
     if not recipient_user.email_notifications:
@@ -112,7 +113,7 @@ def send_status_change_notification(ticket, old_status, new_status, recipient_us
         new_status: New status
         recipient_user: User to receive notification
     """
-    if not current_app.config.get('ENABLE_EMAIL_NOTIFICATIONS', True):
+    if not current_app.config['ENABLE_EMAIL_NOTIFICATIONS']:
         return
     
     if not recipient_user.email_notifications:
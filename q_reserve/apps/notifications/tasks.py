@@ -0,0 +1,107 @@
+"""
+Background notification tasks for Q-Reserve.
+
+Tasks in this module run on Celery workers so that slow mail servers never
+hold up a web request. Tasks take IDs (or, for password resets, the submitted
+address) rather than ORM objects and load fresh rows in the worker's own
+session.
+"""
+
+import smtplib
+from datetime import datetime, timedelta
+from flask import current_app
+
+from core.extensions import celery, db
+
+# Retry policy for tasks that talk to the mail server: connection errors and
+# SMTP errors are retried with exponential backoff (up to 10 minutes apart)
+EMAIL_RETRY_OPTIONS = {
+    'autoretry_for': (smtplib.SMTPException, OSError),
+    'retry_backoff': True,
+    'retry_backoff_max': 600,
+    'retry_kwargs': {'max_retries': 5},
+}
+
+
+@celery.task(ignore_result=True, **EMAIL_RETRY_OPTIONS)
+def send_welcome_email_task(user_id, base_url):
+    """
+    Send the welcome email for a user.
+    
+    Args:
+        user_id: ID of the user to welcome
+        base_url: External base URL of the originating request, used to
+            build absolute links outside of a request
+    """
+    from apps.users.models import User
+    from apps.notifications.sender import send_welcome_email
+    
+    user = db.session.get(User, user_id)
+    if user is None:
+        current_app.logger.warning(f"Skipping welcome email: user {user_id} no longer exists")
+        return
+    
+    with current_app.test_request_context(base_url=base_url):
+        send_welcome_email(user)
+
+
+@celery.task(ignore_result=True)
+def send_password_reset_email_task(email, base_url):
+    """
+    Issue a password reset token and queue the email to the account's owner.
+    
+    Queued for every forgot-password submission. Addresses without an account
+    are dropped here rather than in the view, so the view's response does not
+    reveal which addresses are registered. The token is issued once; mail
+    failures are retried by send_password_reset_message_task, which resends
+    the same link.
+    
+    The submitted address is part of the task message, so the broker holds
+    user email addresses until the task runs. The timing guarantee needs a
+    real broker: under CELERY_TASK_ALWAYS_EAGER this task and its send run
+    inside the request.
+    
+    Args:
+        email: Lowercased address submitted on the forgot-password form
+        base_url: External base URL of the originating request, used to
+            build absolute links outside of a request
+    """
+    from apps.users.services import get_user_by_email
+    from core.utils import generate_secure_token
+    
+    user = get_user_by_email(email)
+    if user is None:
+        current_app.logger.info("Skipping password reset email: no account for the requested address")
+        return
+    
+    user.password_reset_token = generate_secure_token()
+    user.password_reset_expires = datetime.utcnow() + timedelta(hours=1)
+    db.session.commit()
+    
+    send_password_reset_message_task.delay(user.id, base_url)
+
+
+@celery.task(ignore_result=True, **EMAIL_RETRY_OPTIONS)
+def send_password_reset_message_task(user_id, base_url):
+    """
+    Email a user the password reset link issued for them.
+    
+    Sends the token already stored on the user, so retries deliver the same
+    link. Skipped once the token has been used or has expired.
+    
+    Args:
+        user_id: ID of the user who requested the reset
+        base_url: External base URL of the originating request, used to
+            build absolute links outside of a request
+    """
+    from apps.users.models import User
+    from apps.auth.utils import send_password_reset_email
+    
+    user = db.session.get(User, user_id)
+    if (user is None or not user.password_reset_token
+            or user.password_reset_expires < datetime.utcnow()):
+        current_app.logger.info(f"Skipping password reset email: no pending reset for user {user_id}")
+        return
+    
+    with current_app.test_request_context(base_url=base_url):
+        send_password_reset_email(user)
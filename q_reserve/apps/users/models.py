@@ -7,11 +7,11 @@ profile management, and authentication features.
 
 from datetime import datetime
 from enum import Enum
-from flask_sqlalchemy import SQLAlchemy
+from functools import lru_cache
+from flask import current_app
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy import event
 
 from core.extensions import db
 
@@ -31,6 +31,47 @@ class UserStatus(Enum):
     PENDING = 'pending'
 
 
+def _any_ticket(user, ticket):
+    """Ticket rule for roles with access to every ticket."""
+    return True
+
+
+def _own_ticket(user, ticket):
+    """Ticket rule for roles limited to tickets they created."""
+    return ticket.created_by_id == user.id
+
+
+def _no_ticket(user, ticket):
+    """Ticket rule for roles missing from the table (e.g. legacy values)."""
+    return False
+
+
+@lru_cache(maxsize=None)
+def _password_hash_prefix(method):
+    """
+    Get the method prefix werkzeug writes for a hash method.
+    
+    Shorthand methods expand to their full parameters (e.g. "scrypt" becomes
+    "scrypt:32768:8:1"), so the prefix is taken from a real hash, computed
+    once per method.
+    """
+    return generate_password_hash('', method=method).split('$', 1)[0]
+
+
+# Roles with staff privileges (ticket assignment and access to all tickets)
+_STAFF_ROLES = frozenset({UserRole.AGENT, UserRole.ADMIN})
+
+
+# Per-role ticket view checks, looked up by role instead of testing each
+# role in turn: admins and agents can view any ticket, end users only their
+# own, and any other role none.
+_TICKET_VIEW_RULES = {
+    UserRole.ADMIN: _any_ticket,
+    UserRole.AGENT: _any_ticket,
+    UserRole.END_USER: _own_ticket,
+}
+
+
 class User(UserMixin, db.Model):
     """User model with role-based access control."""
     
@@ -66,14 +107,20 @@ class User(UserMixin, db.Model):
     email_notifications = db.Column(db.Boolean, default=True)
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Inserts still send utcnow, so tables created before the server defaults
+    # (there is no migration adding them) keep working; onupdate is rendered
+    # into the UPDATE. timezone('utc', now()) is PostgreSQL-only.
+    created_at = db.Column(db.DateTime, default=datetime.utcnow,
+                           server_default=db.func.timezone('utc', db.func.now()), nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow,
+                           server_default=db.func.timezone('utc', db.func.now()),
+                           onupdate=db.func.timezone('utc', db.func.now()))
     last_login = db.Column(db.DateTime)
     email_verified_at = db.Column(db.DateTime)
     
-    # Authentication tokens
-    email_verification_token = db.Column(db.String(255))
-    password_reset_token = db.Column(db.String(255))
+    # Authentication tokens (indexed: looked up directly from emailed links)
+    email_verification_token = db.Column(db.String(255), index=True)
+    password_reset_token = db.Column(db.String(255), index=True)
     password_reset_expires = db.Column(db.DateTime)
     
     # Statistics (for gamification)
@@ -110,12 +157,19 @@ class User(UserMixin, db.Model):
     @password.setter
     def password(self, password):
         """Password property setter."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(
+            password, method=current_app.config['PASSWORD_HASH_METHOD']
+        )
     
     def verify_password(self, password):
         """Verify password against hash."""
         return check_password_hash(self.password_hash, password)
     
+    def password_needs_rehash(self):
+        """Check if the stored hash uses a different method or cost than configured."""
+        method = current_app.config['PASSWORD_HASH_METHOD']
+        return self.password_hash.split('$', 1)[0] != _password_hash_prefix(method)
+    
     @hybrid_property
     def full_name(self):
         """Get user's full name."""
@@ -156,7 +210,7 @@ class User(UserMixin, db.Model):
     @property
     def can_assign_tickets(self):
         """Check if user can assign tickets."""
-        return self.is_active_user and (self.is_agent or self.is_admin)
+        return self.is_active_user and self.role in _STAFF_ROLES
     
     @property
     def can_manage_users(self):
@@ -171,7 +225,7 @@ class User(UserMixin, db.Model):
     @property
     def can_view_all_tickets(self):
         """Check if user can view all tickets."""
-        return self.is_active_user and (self.is_agent or self.is_admin)
+        return self.is_active_user and self.role in _STAFF_ROLES
     
     @property
     def avatar_url(self):
@@ -182,38 +236,30 @@ class User(UserMixin, db.Model):
         return f"https://www.gravatar.com/avatar/{hash(self.email)}?d=identicon&s=80"
     
     def update_last_login(self):
-        """Update last login timestamp."""
+        """
+        Update last login timestamp.
+        
+        The caller is responsible for committing the session.
+        """
         self.last_login = datetime.utcnow()
-        db.session.commit()
     
     def add_points(self, points):
-        """Add points for gamification."""
+        """
+        Add points for gamification.
+        
+        The caller is responsible for committing the session.
+        """
         self.points += points
-        db.session.commit()
     
     def can_edit_ticket(self, ticket):
         """Check if user can edit a specific ticket."""
-        if not self.is_active_user:
-            return False
-        
-        # Admins and agents can edit any ticket
-        if self.is_admin or self.is_agent:
-            return True
-        
-        # End users can only edit their own tickets
-        return ticket.created_by_id == self.id
+        # Editing is allowed exactly where viewing is
+        return self.can_view_ticket(ticket)
     
     def can_view_ticket(self, ticket):
         """Check if user can view a specific ticket."""
-        if not self.is_active_user:
-            return False
-        
-        # Admins and agents can view all tickets
-        if self.is_admin or self.is_agent:
-            return True
-        
-        # End users can only view their own tickets
-        return ticket.created_by_id == self.id
+        rule = _TICKET_VIEW_RULES.get(self.role, _no_ticket)
+        return self.is_active_user and rule(self, ticket)
     
     def get_accessible_tickets(self):
         """Get query for tickets accessible to this user."""
@@ -250,13 +296,6 @@ class User(UserMixin, db.Model):
         return f'<User {self.username}>'
 
 
-# Event listeners for automatic updates
-@event.listens_for(User, 'before_update')
-def update_modified_time(mapper, connection, target):
-    """Update the updated_at timestamp on user updates."""
-    target.updated_at = datetime.utcnow()
-
-
 # TODO: Add user activity logging
 # TODO: Add user preferences management
 # TODO: Add social login integration (OAuth)
@@ -0,0 +1,24 @@
+"""
+User services for Q-Reserve application.
+
+This module contains user lookup and management helpers shared by the
+auth and users blueprints.
+"""
+
+from apps.users.models import User
+
+
+def get_user_by_email(email):
+    """
+    Get the user registered with an email address.
+    
+    Args:
+        email: Email address (matched case-insensitively)
+    
+    Returns:
+        User or None
+    """
+    return User.query.filter_by(email=email.lower()).first()
+
+
+# TODO: Add user search and filtering helpers
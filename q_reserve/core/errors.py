@@ -4,9 +4,8 @@ Error handlers for Q-Reserve application.
 This module defines custom error handlers for HTTP errors and application-specific exceptions.
 """
 
-from flask import render_template, request, jsonify, current_app
-from werkzeug.exceptions import HTTPException
-import logging
+import json
+from flask import render_template, request, jsonify, current_app, Response
 
 
 class QReserveException(Exception):
@@ -70,6 +69,32 @@ class RateLimitError(QReserveException):
         super().__init__(message, status_code=429)
 
 
+# Messages for the generic HTTP error responses
+HTTP_ERROR_MESSAGES = {
+    400: 'Bad request',
+    401: 'Authentication required',
+    403: 'Access forbidden',
+    404: 'Resource not found',
+    405: 'Method not allowed',
+    429: 'Rate limit exceeded',
+    500: 'Internal server error',
+    503: 'Service temporarily unavailable',
+}
+
+# JSON bodies are fixed per status code, so encode them once at import
+_JSON_ERROR_BODIES = {
+    status_code: json.dumps({'message': message, 'status_code': status_code}).encode('utf-8')
+    for status_code, message in HTTP_ERROR_MESSAGES.items()
+}
+
+
+def json_error_response(status_code):
+    """Build a JSON error response from the pre-encoded body for status_code."""
+    return Response(_JSON_ERROR_BODIES[status_code],
+                    status=status_code,
+                    mimetype='application/json')
+
+
 def register_error_handlers(app):
     """Register error handlers with Flask app."""
     
@@ -78,7 +103,7 @@ def register_error_handlers(app):
         """Handle custom Q-Reserve exceptions."""
         current_app.logger.error(f'QReserve exception: {error.message}')
         
-        if request.content_type == 'application/json' or request.is_json:
+        if request.is_json:
             return jsonify(error.to_dict()), error.status_code
         
         return render_template('errors/error.html',
@@ -90,11 +115,8 @@ def register_error_handlers(app):
         """Handle 400 Bad Request errors."""
         current_app.logger.warning(f'Bad request: {request.url}')
         
-        if request.content_type == 'application/json' or request.is_json:
-            return jsonify({
-                'message': 'Bad request',
-                'status_code': 400
-            }), 400
+        if request.is_json:
+            return json_error_response(400)
         
         return render_template('errors/400.html'), 400
     
@@ -103,11 +125,8 @@ def register_error_handlers(app):
         """Handle 401 Unauthorized errors."""
         current_app.logger.warning(f'Unauthorized access: {request.url}')
         
-        if request.content_type == 'application/json' or request.is_json:
-            return jsonify({
-                'message': 'Authentication required',
-                'status_code': 401
-            }), 401
+        if request.is_json:
+            return json_error_response(401)
         
         return render_template('errors/401.html'), 401
     
@@ -116,11 +135,8 @@ def register_error_handlers(app):
         """Handle 403 Forbidden errors."""
         current_app.logger.warning(f'Forbidden access: {request.url}')
         
-        if request.content_type == 'application/json' or request.is_json:
-            return jsonify({
-                'message': 'Access forbidden',
-                'status_code': 403
-            }), 403
+        if request.is_json:
+            return json_error_response(403)
         
         return render_template('errors/403.html'), 403
     
@@ -129,11 +145,8 @@ def register_error_handlers(app):
         """Handle 404 Not Found errors."""
         current_app.logger.info(f'Not found: {request.url}')
         
-        if request.content_type == 'application/json' or request.is_json:
-            return jsonify({
-                'message': 'Resource not found',
-                'status_code': 404
-            }), 404
+        if request.is_json:
+            return json_error_response(404)
         
         return render_template('errors/404.html'), 404
     
@@ -142,11 +155,8 @@ def register_error_handlers(app):
         """Handle 405 Method Not Allowed errors."""
         current_app.logger.warning(f'Method not allowed: {request.method} {request.url}')
         
-        if request.content_type == 'application/json' or request.is_json:
-            return jsonify({
-                'message': 'Method not allowed',
-                'status_code': 405
-            }), 405
+        if request.is_json:
+            return json_error_response(405)
         
         return render_template('errors/405.html'), 405
     
@@ -155,11 +165,8 @@ def register_error_handlers(app):
         """Handle 429 Rate Limit Exceeded errors."""
         current_app.logger.warning(f'Rate limit exceeded: {request.url}')
         
-        if request.content_type == 'application/json' or request.is_json:
-            return jsonify({
-                'message': 'Rate limit exceeded',
-                'status_code': 429
-            }), 429
+        if request.is_json:
+            return json_error_response(429)
         
         return render_template('errors/429.html'), 429
     
@@ -168,11 +175,8 @@ def register_error_handlers(app):
         """Handle 500 Internal Server Error."""
         current_app.logger.error(f'Server error: {error}', exc_info=True)
         
-        if request.content_type == 'application/json' or request.is_json:
-            return jsonify({
-                'message': 'Internal server error',
-                'status_code': 500
-            }), 500
+        if request.is_json:
+            return json_error_response(500)
         
         return render_template('errors/500.html'), 500
     
@@ -181,11 +185,8 @@ def register_error_handlers(app):
         """Handle 503 Service Unavailable errors."""
         current_app.logger.error(f'Service unavailable: {error}')
         
-        if request.content_type == 'application/json' or request.is_json:
-            return jsonify({
-                'message': 'Service temporarily unavailable',
-                'status_code': 503
-            }), 503
+        if request.is_json:
+            return json_error_response(503)
         
         return render_template('errors/503.html'), 503
 
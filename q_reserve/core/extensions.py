@@ -79,6 +79,8 @@ def init_celery(app):
         accept_content=['json'],
         timezone='UTC',
         enable_utc=True,
+        imports=('apps.notifications.tasks',),
+        task_always_eager=app.config['CELERY_TASK_ALWAYS_EAGER'],
         task_routes={
             'apps.notifications.tasks.*': {'queue': 'notifications'},
             'apps.ai.tasks.*': {'queue': 'ai'},
@@ -101,7 +103,7 @@ def load_user(user_id):
     """Load user for Flask-Login."""
     # Import here to avoid circular imports
     from apps.users.models import User
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id))
 
 
 # TODO: Add health check endpoints for extensions
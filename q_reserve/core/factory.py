@@ -7,13 +7,15 @@ with proper configuration, extension initialization, and blueprint registration.
 
 import os
 import logging
+import importlib
 from logging.handlers import RotatingFileHandler
-from flask import Flask, render_template, request, redirect, url_for
+from flask import Flask, abort, request, redirect, url_for
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.middleware.proxy_fix import ProxyFix
 import click
 
 from core.config import get_config
-from core.extensions import init_extensions
+from core.extensions import init_extensions, login_manager
 from core.errors import register_error_handlers
 from core.utils import register_template_filters
 
@@ -47,6 +49,9 @@ def create_app(config_name=None):
     # Register error handlers
     register_error_handlers(app)
     
+    # Configure template compilation caching
+    configure_jinja(app)
+    
     # Register template filters and globals
     register_template_filters(app)
     
@@ -65,32 +70,39 @@ def create_app(config_name=None):
     return app
 
 
+# (module path, blueprint attribute, URL prefix) for every application blueprint.
+# Modules are imported only when their blueprint is registered, so processes
+# that enable a subset of blueprints never pay for the others' imports.
+BLUEPRINTS = (
+    ('apps.auth.routes', 'bp', '/auth'),
+    ('apps.users.routes', 'bp', '/users'),
+    ('apps.categories.routes', 'bp', '/categories'),
+    ('apps.tickets.routes', 'bp', '/tickets'),
+    ('apps.notifications.routes', 'bp', '/notifications'),
+    ('apps.dashboard.routes', 'bp', '/dashboard'),
+)
+
+
 def register_blueprints(app):
-    """Register all application blueprints."""
-    
-    # Authentication blueprint
-    from apps.auth.routes import bp as auth_bp
-    app.register_blueprint(auth_bp, url_prefix='/auth')
-    
-    # Users blueprint
-    from apps.users.routes import bp as users_bp
-    app.register_blueprint(users_bp, url_prefix='/users')
-    
-    # Categories blueprint
-    from apps.categories.routes import bp as categories_bp
-    app.register_blueprint(categories_bp, url_prefix='/categories')
+    """Register application blueprints enabled by ENABLED_BLUEPRINTS."""
+    enabled = app.config.get('ENABLED_BLUEPRINTS')
     
-    # Tickets blueprint
-    from apps.tickets.routes import bp as tickets_bp
-    app.register_blueprint(tickets_bp, url_prefix='/tickets')
+    if enabled is not None:
+        unknown = set(enabled) - {url_prefix.strip('/') for _, _, url_prefix in BLUEPRINTS}
+        if unknown:
+            raise ValueError(f"Unknown blueprints in ENABLED_BLUEPRINTS: {', '.join(sorted(unknown))}")
     
-    # Notifications blueprint
-    from apps.notifications.routes import bp as notifications_bp
-    app.register_blueprint(notifications_bp, url_prefix='/notifications')
+    for module_path, attr, url_prefix in BLUEPRINTS:
+        if enabled is not None and url_prefix.strip('/') not in enabled:
+            continue
+        
+        module = importlib.import_module(module_path)
+        app.register_blueprint(getattr(module, attr), url_prefix=url_prefix)
     
-    # Dashboard blueprint
-    from apps.dashboard.routes import bp as dashboard_bp
-    app.register_blueprint(dashboard_bp, url_prefix='/dashboard')
+    # Without the auth blueprint there is no login page to redirect to, so
+    # login_required views answer 401 instead
+    if 'auth' not in app.blueprints:
+        login_manager.login_view = None
     
     # Main routes (home page, etc.)
     register_main_routes(app)
@@ -104,13 +116,21 @@ def register_main_routes(app):
         """Home page route."""
         from flask_login import current_user
         if current_user.is_authenticated:
-            if current_user.role == 'admin':
-                return redirect(url_for('dashboard.admin'))
-            elif current_user.role == 'agent':
-                return redirect(url_for('dashboard.agent'))
+            if current_user.is_admin:
+                endpoints = ('dashboard.admin', 'tickets.list')
+            elif current_user.is_agent:
+                endpoints = ('dashboard.agent', 'tickets.list')
             else:
-                return redirect(url_for('tickets.list'))
-        return render_template('auth/login.html')
+                endpoints = ('tickets.list',)
+        else:
+            endpoints = ('auth.login',)
+        
+        # Redirect to the first home page this process serves; blueprints
+        # left out of ENABLED_BLUEPRINTS have no endpoints to build
+        for endpoint in endpoints:
+            if endpoint in app.view_functions:
+                return redirect(url_for(endpoint))
+        abort(404)
     
     @app.route('/health')
     def health_check():
@@ -118,6 +138,18 @@ def register_main_routes(app):
         return {'status': 'healthy'}, 200
 
 
+def configure_jinja(app):
+    """Persist compiled template bytecode when JINJA_BYTECODE_CACHE_DIR is set."""
+    cache_dir = app.config.get('JINJA_BYTECODE_CACHE_DIR')
+    if not cache_dir:
+        return
+    
+    # Workers and restarts load compiled templates from disk instead of
+    # re-parsing and compiling them; stale entries are detected by source checksum
+    os.makedirs(cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+
 def configure_logging(app):
     """Configure application logging."""
     if not app.debug and not app.testing:
@@ -147,7 +179,6 @@ def register_cli_commands(app):
     @app.cli.command()
     def init_db():
         """Initialize the database."""
-        from core.extensions import db
         from scripts.init_db import init_database
         init_database()
         click.echo('Database initialized.')
@@ -9,10 +9,9 @@ import os
 import secrets
 import hashlib
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional
 from flask import current_app, url_for
 from werkzeug.utils import secure_filename
-import magic
 
 
 def generate_secure_token(length: int = 32) -> str:
@@ -50,6 +49,9 @@ def allowed_file(filename: str) -> bool:
 
 def get_file_type(filepath: str) -> str:
     """Get MIME type of file using python-magic."""
+    # Imported lazily: loading libmagic is only needed for uploads, not app startup
+    import magic
+    
     try:
         return magic.from_file(filepath, mime=True)
     except Exception:
@@ -76,9 +78,9 @@ def secure_file_upload(file, upload_folder: str, subfolder: str = None) -> Optio
     if not filename:
         return None
     
-    # Add timestamp to prevent conflicts
-    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S_')
-    filename = f"{timestamp}{filename}"
+    # Add a random prefix to prevent conflicts (a timestamp collides for
+    # uploads of the same name within one second)
+    filename = f"{secrets.token_hex(4)}_{filename}"
     
     # Create full path
     if subfolder:
@@ -119,18 +121,22 @@ def is_sla_breached(deadline: datetime, resolved_at: datetime = None) -> bool:
     return check_time > deadline
 
 
+_SIZE_NAMES = ("B", "KB", "MB", "GB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format."""
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    
-    return f"{size_bytes:.1f} {size_names[i]}"
+    # Sizes under 1 KB (including fractions and negatives) stay in bytes;
+    # above that each unit is 2**10 times the previous one, so the unit
+    # index is the number of whole 10-bit groups in the size
+    if size_bytes < 1024:
+        i = 0
+    else:
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_NAMES) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_NAMES[i]}"
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -200,6 +206,11 @@ def register_template_filters(app):
         args.update(kwargs)
         return url_for(endpoint, **args)
     
+    @app.template_global('blueprint_enabled')
+    def blueprint_enabled(name):
+        """Template global for checking that a blueprint is registered."""
+        return name in app.blueprints
+    
     @app.template_global('current_year')
     def current_year():
         """Template global for current year."""
@@ -0,0 +1,27 @@
+"""
+Shared pytest fixtures for Q-Reserve tests.
+
+The app fixture is picked up by pytest-flask, which provides client and
+other request fixtures on top of it.
+"""
+
+import pytest
+
+from core.config import TestingConfig
+from core.factory import create_app
+
+
+@pytest.fixture
+def app():
+    """Create an application with the testing configuration."""
+    app = create_app('testing')
+    app.config['WTF_CSRF_ENABLED'] = False
+    return app
+
+
+@pytest.fixture
+def subset_app(monkeypatch):
+    """Create an application with only the auth and tickets blueprints."""
+    monkeypatch.setattr(TestingConfig, 'ENABLED_BLUEPRINTS', frozenset({'auth', 'tickets'}))
+    return create_app('testing')
+
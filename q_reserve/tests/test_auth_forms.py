@@ -0,0 +1,77 @@
+"""
+Tests for the authentication forms.
+"""
+
+import pytest
+
+from apps.auth.forms import RegistrationForm
+from core.extensions import db
+
+REGISTRATION_DATA = {
+    'first_name': 'Ada',
+    'last_name': 'Lovelace',
+    'username': 'ada',
+    'email': 'Ada@Example.com',
+    'password': 'Secret123',
+    'confirm_password': 'Secret123',
+}
+
+
+class _Result:
+    """Stand-in for the result of the uniqueness query."""
+    
+    def __init__(self, rows):
+        self._rows = rows
+    
+    def all(self):
+        return self._rows
+
+
+@pytest.fixture
+def taken(monkeypatch):
+    """Set the (username, email) rows the uniqueness query returns."""
+    rows = []
+    monkeypatch.setattr(db.session, 'execute', lambda statement: _Result(rows))
+    return rows
+
+
+def validate_registration(app):
+    with app.test_request_context(method='POST', data=REGISTRATION_DATA):
+        form = RegistrationForm()
+        return form.validate(), form
+
+
+def test_registration_accepts_unused_username_and_email(app, taken):
+    valid, form = validate_registration(app)
+    
+    assert valid
+    assert not form.errors
+
+
+def test_registration_rejects_duplicate_username(app, taken):
+    taken.append(('ada', 'someone@example.com'))
+    
+    valid, form = validate_registration(app)
+    
+    assert not valid
+    assert form.username.errors == ['Username already exists. Please choose a different one.']
+    assert not form.email.errors
+
+
+def test_registration_rejects_duplicate_email(app, taken):
+    taken.append(('someone', 'ada@example.com'))
+    
+    valid, form = validate_registration(app)
+    
+    assert not valid
+    assert form.email.errors == ['Email already registered. Please use a different email or try logging in.']
+    assert not form.username.errors
+
+
+def test_registration_reports_both_duplicates(app, taken):
+    taken.extend([('ada', 'someone@example.com'), ('someone', 'ada@example.com')])
+    
+    valid, form = validate_registration(app)
+    
+    assert not valid
+    assert form.username.errors and form.email.errors
@@ -0,0 +1,31 @@
+"""
+Tests for the application factory.
+"""
+
+import pytest
+
+from core.factory import create_app
+
+
+def test_subset_registers_only_enabled_blueprints(subset_app):
+    assert set(subset_app.blueprints) == {'auth', 'tickets'}
+
+
+def test_subset_renders_index(subset_app):
+    client = subset_app.test_client()
+    
+    response = client.get('/')
+    assert response.status_code == 302
+    assert response.headers['Location'].endswith('/auth/login')
+    
+    response = client.get('/', follow_redirects=True)
+    assert response.status_code == 200
+    assert b'Forgot your password?' in response.data
+
+
+def test_unknown_blueprint_is_rejected(monkeypatch):
+    from core.config import TestingConfig
+    monkeypatch.setattr(TestingConfig, 'ENABLED_BLUEPRINTS', frozenset({'auth', 'tickit'}))
+    
+    with pytest.raises(ValueError, match='tickit'):
+        create_app('testing')